@@ -3,7 +3,6 @@ Django settings for alx_backend_caching_property_listings project.
 """
 import os
 from pathlib import Path
-from datetime import timedelta
 
 # Build paths inside the project
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -33,16 +32,17 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
-    'django.middleware.cache.UpdateCacheMiddleware',  # Cache middleware
     'django.middleware.common.CommonMiddleware',
-    'django.middleware.cache.FetchFromCacheMiddleware',  # Cache middleware
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'debug_toolbar.middleware.DebugToolbarMiddleware',
 ]
 
+# Views are cached explicitly with cache_page; only run the toolbar in development
+if DEBUG:
+    MIDDLEWARE.append('debug_toolbar.middleware.DebugToolbarMiddleware')
+
 ROOT_URLCONF = 'alx_backend_caching_property_listings.urls'
 
 TEMPLATES = [
@@ -70,36 +70,60 @@ DATABASES = {
         'NAME': os.getenv('DB_NAME', 'property_listings'),
         'USER': os.getenv('DB_USER', 'property_user'),
         'PASSWORD': os.getenv('DB_PASSWORD', 'secure_password'),
+        # Connections go through PgBouncer (transaction pooling, see docker-compose.yml)
         'HOST': os.getenv('DB_HOST', 'localhost'),
-        'PORT': os.getenv('DB_PORT', '5432'),
+        'PORT': os.getenv('DB_PORT', '6432'),
         'OPTIONS': {
             'connect_timeout': 10,
         },
-        'CONN_MAX_AGE': 60,  # Connection pooling
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '600')),  # Persistent connections to PgBouncer
+        'CONN_HEALTH_CHECKS': True,
+        # Server-side cursors don't survive transaction pooling
+        'DISABLE_SERVER_SIDE_CURSORS': True,
     }
 }
 
+# Redis connection pool settings shared by all cache aliases
+REDIS_CONNECTION_POOL_KWARGS = {
+    'max_connections': 32,
+    'retry_on_timeout': True,
+    'health_check_interval': 30,  # seconds
+    'socket_keepalive': True,
+    # RESP3 is a connection option; it must be set on the pool because
+    # client kwargs are ignored when django-redis passes a pool in
+    'protocol': 3,
+}
+
 # Redis Cache Configuration
 CACHES = {
     'default': {
         'BACKEND': 'django_redis.cache.RedisCache',
         'LOCATION': 'redis://:redis_password@localhost:6379/0',
         'OPTIONS': {
-            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'CLIENT_CLASS': 'properties.cache_clients.NearCacheClient',
+            # Hot keys served from process memory for NEAR_CACHE_TIMEOUT seconds
+            'NEAR_CACHE_KEYS': (
+                'all_properties',
+                'featured_properties',
+                'properties_last_modified',
+                'property_',
+            ),
+            'NEAR_CACHE_TIMEOUT': 2,  # seconds
+            'NEAR_CACHE_MAX_ENTRIES': 256,
             'PASSWORD': 'redis_password',
             'SOCKET_CONNECT_TIMEOUT': 5,  # seconds
             'SOCKET_TIMEOUT': 5,  # seconds
-            'CONNECTION_POOL_KWARGS': {
-                'max_connections': 100,
-                'retry_on_timeout': True,
-            },
-            'PARSER_CLASS': 'redis.connection.HiredisParser',
-            'COMPRESSOR': 'django_redis.compressors.zlib.ZlibCompressor',
+            'CONNECTION_POOL_KWARGS': REDIS_CONNECTION_POOL_KWARGS,
+            # C reply parser (needs the hiredis package); redis-py 5 renamed
+            # it from HiredisParser to _HiredisParser
+            'PARSER_CLASS': 'redis.connection._HiredisParser',
+            'COMPRESSOR': 'properties.compressors.ZstdCompressor',
+            'SERIALIZER': 'properties.cache_serializers.PropertyMSGPackSerializer',
             'IGNORE_EXCEPTIONS': False,
         },
         'KEY_PREFIX': 'property_listings',
         'TIMEOUT': 3600,  # Default cache timeout in seconds
-        'VERSION': 1,
+        'VERSION': 5,  # Bump whenever the format of cached values changes
     },
     'session': {
         'BACKEND': 'django_redis.cache.RedisCache',
@@ -107,6 +131,9 @@ CACHES = {
         'OPTIONS': {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
             'PASSWORD': 'redis_password',
+            'SOCKET_CONNECT_TIMEOUT': 5,  # seconds
+            'SOCKET_TIMEOUT': 5,  # seconds
+            'CONNECTION_POOL_KWARGS': REDIS_CONNECTION_POOL_KWARGS,
         },
         'KEY_PREFIX': 'sessions',
     }
@@ -116,7 +143,7 @@ CACHES = {
 SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
 SESSION_CACHE_ALIAS = 'session'
 
-# Cache middleware settings
+# Defaults for cache_page
 CACHE_MIDDLEWARE_ALIAS = 'default'
 CACHE_MIDDLEWARE_SECONDS = 300  # 5 minutes
 CACHE_MIDDLEWARE_KEY_PREFIX = 'property_listings'
@@ -141,6 +168,10 @@ STATICFILES_DIRS = [BASE_DIR / 'static']
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Logging Configuration
+# Log records are queued and written to LOG_FILE by a background
+# QueueListener (started in PropertiesConfig.ready)
+LOG_FILE = BASE_DIR / 'logs' / 'django.log'
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -148,23 +179,22 @@ LOGGING = {
         'console': {
             'class': 'logging.StreamHandler',
         },
-        'file': {
-            'class': 'logging.FileHandler',
-            'filename': BASE_DIR / 'logs' / 'django.log',
+        'queue': {
+            '()': 'properties.log_handlers.queue_handler',
         },
     },
     'loggers': {
         'django': {
-            'handlers': ['console', 'file'],
+            'handlers': ['console', 'queue'],
             'level': 'INFO',
         },
         'properties': {
-            'handlers': ['console', 'file'],
+            'handlers': ['console', 'queue'],
             'level': 'DEBUG',
         },
         'django.db.backends': {
             'handlers': ['console'],
-            'level': 'DEBUG',
+            'level': 'DEBUG' if DEBUG else 'WARNING',
             'propagate': False,
         },
     },
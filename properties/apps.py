@@ -1,3 +1,4 @@
+import threading
 from django.apps import AppConfig
 
 class PropertiesConfig(AppConfig):
@@ -10,8 +11,26 @@ class PropertiesConfig(AppConfig):
         """
         import properties.signals
         
-        # Initialize cache on startup
-        self.initialize_cache()
+        # Drain queued log records to the log file off the request thread
+        self.start_log_listener()
+        
+        # Probe the cache in the background so worker boot doesn't wait on Redis
+        threading.Thread(
+            target=self.initialize_cache,
+            name='properties-cache-probe',
+            daemon=True,
+        ).start()
+    
+    def start_log_listener(self):
+        """
+        Start the background writer for the 'queue' logging handler
+        """
+        from django.conf import settings
+        from properties.log_handlers import start_file_listener
+        
+        log_file = getattr(settings, 'LOG_FILE', None)
+        if log_file:
+            start_file_listener(log_file)
     
     def initialize_cache(self):
         """
@@ -0,0 +1,198 @@
+"""
+Custom django-redis clients for property caching
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django_redis.client import DefaultClient
+from django_redis.client.default import _main_exceptions
+from django_redis.exceptions import ConnectionInterrupted
+
+_MISSING = object()
+
+# One near cache per process, shared by every NearCacheClient: Django builds
+# a separate cache backend (and client) for each thread
+_near_cache = OrderedDict()
+_near_lock = threading.Lock()
+
+# Bumped on every eviction; a Redis read started under an older generation
+# may predate the change and is not stored locally
+_near_generation = 0
+
+# Last properties version seen by near_cache_observe_version()
+_near_version = None
+
+
+def near_cache_evict(made_keys):
+    """
+    Drop already-prefixed keys from this process's near cache
+
+    For code that writes or deletes through the raw Redis client (Lua
+    scripts, pipelines) rather than through ``cache``.
+    """
+    global _near_generation
+
+    with _near_lock:
+        _near_generation += 1
+        for made_key in made_keys:
+            _near_cache.pop(made_key, None)
+
+
+def near_cache_clear():
+    """
+    Empty this process's near cache
+    """
+    global _near_generation
+
+    with _near_lock:
+        _near_generation += 1
+        _near_cache.clear()
+
+
+def near_cache_observe_version(version):
+    """
+    Empty the near cache when the properties version has moved
+
+    Writes in other processes bump the version in Redis; whoever reads it
+    calls this first, so values cached under the new version (e.g. by
+    cache_page) are never built from near-cache entries that predate it.
+    """
+    global _near_generation, _near_version
+
+    with _near_lock:
+        if version != _near_version:
+            _near_version = version
+            _near_generation += 1
+            _near_cache.clear()
+
+
+class NearCacheClient(DefaultClient):
+    """
+    DefaultClient with a small in-process cache in front of hot keys.
+
+    ``get``/``get_many`` for keys starting with one of ``NEAR_CACHE_KEYS`` are answered
+    from process memory for up to ``NEAR_CACHE_TIMEOUT`` seconds instead of
+    a Redis round trip. Entries hold the raw encoded bytes, so every hit
+    decodes a fresh copy and callers can't mutate each other's values.
+
+    The near cache is shared by all threads of the process. Writing or
+    deleting a key through any client evicts just that key, and for raw
+    Redis writes there are near_cache_evict()/near_cache_clear(). Writes
+    in other processes are picked up as soon as this process reads the
+    new properties version (near_cache_observe_version); until then, reads
+    of these keys may be up to ``NEAR_CACHE_TIMEOUT`` seconds stale.
+    """
+
+    def __init__(self, server, params, backend):
+        super().__init__(server, params, backend)
+
+        options = params.get('OPTIONS', {})
+        self._near_keys = tuple(options.get('NEAR_CACHE_KEYS', ()))
+        self._near_timeout = options.get('NEAR_CACHE_TIMEOUT', 2)
+        self._near_max_entries = options.get('NEAR_CACHE_MAX_ENTRIES', 256)
+
+    def _near_get(self, key):
+        with _near_lock:
+            entry = _near_cache.get(key)
+            if entry is None:
+                return _MISSING
+            raw, expires_at = entry
+            if expires_at < time.monotonic():
+                del _near_cache[key]
+                return _MISSING
+            _near_cache.move_to_end(key)
+            return raw
+
+    def _near_set(self, key, raw, generation):
+        with _near_lock:
+            if generation != _near_generation:
+                # Evicted or version moved while the value was in flight
+                return
+            _near_cache[key] = (raw, time.monotonic() + self._near_timeout)
+            _near_cache.move_to_end(key)
+            while len(_near_cache) > self._near_max_entries:
+                _near_cache.popitem(last=False)
+
+    def get(self, key, default=None, version=None, client=None):
+        if not self._near_keys or not str(key).startswith(self._near_keys):
+            return super().get(key, default=default, version=version, client=client)
+
+        made_key = self.make_key(key, version=version)
+        raw = self._near_get(made_key)
+
+        if raw is _MISSING:
+            generation = _near_generation
+            if client is None:
+                client = self.get_client(write=False)
+            try:
+                raw = client.get(made_key)
+            except _main_exceptions as e:
+                raise ConnectionInterrupted(connection=client) from e
+            if raw is None:
+                return default
+            self._near_set(made_key, raw, generation)
+
+        return self.decode(raw)
+
+    def get_many(self, keys, version=None, client=None):
+        if not self._near_keys:
+            return super().get_many(keys, version=version, client=client)
+
+        recovered_data = {}
+        map_keys = {}
+        for key in keys:
+            made_key = self.make_key(key, version=version)
+            if str(key).startswith(self._near_keys):
+                raw = self._near_get(made_key)
+                if raw is not _MISSING:
+                    recovered_data[key] = self.decode(raw)
+                    continue
+            map_keys[made_key] = key
+
+        if not map_keys:
+            return recovered_data
+
+        # One MGET for everything not served locally
+        generation = _near_generation
+        if client is None:
+            client = self.get_client(write=False)
+        try:
+            results = client.mget(*map_keys)
+        except _main_exceptions as e:
+            raise ConnectionInterrupted(connection=client) from e
+
+        for made_key, raw in zip(map_keys, results):
+            if raw is None:
+                continue
+            key = map_keys[made_key]
+            if str(key).startswith(self._near_keys):
+                self._near_set(made_key, raw, generation)
+            recovered_data[key] = self.decode(raw)
+
+        return recovered_data
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None, client=None, nx=False, xx=False):
+        # set_many() and add() go through here as well
+        near_cache_evict([self.make_key(key, version=version)])
+        return super().set(
+            key, value, timeout=timeout, version=version, client=client, nx=nx, xx=xx
+        )
+
+    def delete(self, key, version=None, prefix=None, client=None):
+        near_cache_evict([self.make_key(key, version=version, prefix=prefix)])
+        return super().delete(key, version=version, prefix=prefix, client=client)
+
+    def delete_many(self, keys, version=None, client=None):
+        keys = list(keys)
+        near_cache_evict([self.make_key(key, version=version) for key in keys])
+        return super().delete_many(keys, version=version, client=client)
+
+    def delete_pattern(self, *args, **kwargs):
+        near_cache_clear()
+        return super().delete_pattern(*args, **kwargs)
+
+    def clear(self, *args, **kwargs):
+        near_cache_clear()
+        return super().clear(*args, **kwargs)
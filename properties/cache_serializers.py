@@ -0,0 +1,68 @@
+"""
+Custom django-redis serializers for property caching
+"""
+import pickle
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+import msgpack
+from django_redis.serializers.base import BaseSerializer
+
+# msgpack extension type codes
+EXT_DECIMAL = 1
+EXT_UUID = 2
+EXT_DATETIME = 3
+EXT_DATE = 4
+EXT_PICKLE = 127
+
+
+def _default(obj):
+    """
+    Encode values msgpack has no native type for
+    """
+    if isinstance(obj, Decimal):
+        return msgpack.ExtType(EXT_DECIMAL, str(obj).encode())
+    if isinstance(obj, uuid.UUID):
+        return msgpack.ExtType(EXT_UUID, obj.bytes)
+    if isinstance(obj, datetime):
+        return msgpack.ExtType(EXT_DATETIME, obj.isoformat().encode())
+    if isinstance(obj, date):
+        return msgpack.ExtType(EXT_DATE, obj.isoformat().encode())
+    # Model instances, HttpResponses from the page cache, etc.
+    return msgpack.ExtType(EXT_PICKLE, pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
+
+
+def _ext_hook(code, data):
+    if code == EXT_DECIMAL:
+        return Decimal(data.decode())
+    if code == EXT_UUID:
+        return uuid.UUID(bytes=data)
+    if code == EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == EXT_DATE:
+        return date.fromisoformat(data.decode())
+    if code == EXT_PICKLE:
+        return pickle.loads(data)
+    return msgpack.ExtType(code, data)
+
+
+class PropertyMSGPackSerializer(BaseSerializer):
+    """
+    msgpack serializer that keeps Decimal, UUID and datetime values intact.
+
+    Plain data (dicts, lists, strings, numbers) is packed natively; any other
+    object falls back to a pickled extension type so existing callers that
+    cache model instances or responses keep working.
+    """
+
+    def dumps(self, value):
+        return msgpack.packb(value, use_bin_type=True, default=_default)
+
+    def loads(self, value):
+        return msgpack.unpackb(
+            value,
+            raw=False,
+            strict_map_key=False,
+            ext_hook=_ext_hook,
+        )
@@ -0,0 +1,47 @@
+"""
+Custom django-redis compressors for property caching
+"""
+import threading
+
+import zstandard
+from django_redis.compressors.base import BaseCompressor
+from django_redis.exceptions import CompressorError
+
+# zstd contexts are not safe for concurrent use, so each thread keeps its own
+_local = threading.local()
+
+
+def _get_compressor():
+    compressor = getattr(_local, 'compressor', None)
+    if compressor is None:
+        compressor = _local.compressor = zstandard.ZstdCompressor(level=1)
+    return compressor
+
+
+def _get_decompressor():
+    decompressor = getattr(_local, 'decompressor', None)
+    if decompressor is None:
+        decompressor = _local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor
+
+
+class ZstdCompressor(BaseCompressor):
+    """
+    Zstandard (level 1) compressor for cached values.
+
+    Values shorter than ``min_length`` bytes are stored uncompressed; the
+    client falls back to the raw bytes when ``decompress`` raises
+    ``CompressorError``.
+    """
+    min_length = 256
+
+    def compress(self, value):
+        if len(value) > self.min_length:
+            return _get_compressor().compress(value)
+        return value
+
+    def decompress(self, value):
+        try:
+            return _get_decompressor().decompress(value)
+        except zstandard.ZstdError as e:
+            raise CompressorError(e)
@@ -0,0 +1,73 @@
+"""
+Non-blocking logging handlers
+"""
+import atexit
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, WatchedFileHandler
+
+_log_queue = queue.Queue(-1)
+_listener = None
+_file_loggers_lock = threading.Lock()
+
+
+def queue_handler():
+    """
+    Handler factory for LOGGING: records are queued, not written inline
+    """
+    return QueueHandler(_log_queue)
+
+
+def start_queue_listener(*handlers):
+    """
+    Start the background thread that drains the log queue into ``handlers``
+
+    Safe to call more than once; only the first call starts a listener.
+    """
+    global _listener
+
+    if _listener is not None:
+        return _listener
+
+    _listener = QueueListener(_log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
+
+
+def start_file_listener(filename):
+    """
+    Start the queue listener writing to a log file
+    """
+    return start_queue_listener(logging.FileHandler(filename))
+
+
+def queued_file_logger(name, filename):
+    """
+    Get a logger whose records are appended to ``filename`` in the background
+
+    Records are written as bare messages by a dedicated QueueListener and
+    don't propagate to the project loggers. Safe to call more than once.
+    """
+    file_logger = logging.getLogger(name)
+
+    if file_logger.handlers:
+        return file_logger
+
+    # Concurrent first calls must not attach two handlers and listeners
+    with _file_loggers_lock:
+        if not file_logger.handlers:
+            file_queue = queue.Queue(-1)
+            file_handler = WatchedFileHandler(filename)
+            file_handler.setFormatter(logging.Formatter('%(message)s'))
+
+            listener = QueueListener(file_queue, file_handler)
+            listener.start()
+            atexit.register(listener.stop)
+
+            file_logger.addHandler(QueueHandler(file_queue))
+            file_logger.setLevel(logging.INFO)
+            file_logger.propagate = False
+
+    return file_logger
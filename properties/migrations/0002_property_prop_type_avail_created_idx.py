@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['property_type', 'is_available', '-created_at'], include=('title', 'price', 'location'), name='prop_type_avail_created_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+    """
+    Replace the random UUID primary key with a BigAutoField.
+
+    The existing UUID column is renamed to ``public_id`` and keeps its
+    values, so URLs and cache keys built from it stay valid.
+    """
+
+    dependencies = [
+        ('properties', '0002_property_prop_type_avail_created_idx'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql=[
+                        'ALTER TABLE properties_property RENAME COLUMN id TO public_id',
+                        'ALTER TABLE properties_property DROP CONSTRAINT properties_property_pkey',
+                        'ALTER TABLE properties_property ADD CONSTRAINT properties_property_public_id_key UNIQUE (public_id)',
+                        'ALTER TABLE properties_property ADD COLUMN id bigint GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY',
+                    ],
+                    reverse_sql=[
+                        'ALTER TABLE properties_property DROP COLUMN id',
+                        'ALTER TABLE properties_property DROP CONSTRAINT properties_property_public_id_key',
+                        'ALTER TABLE properties_property RENAME COLUMN public_id TO id',
+                        'ALTER TABLE properties_property ADD PRIMARY KEY (id)',
+                    ],
+                ),
+            ],
+            state_operations=[
+                migrations.AddField(
+                    model_name='property',
+                    name='public_id',
+                    field=models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+                ),
+                migrations.AlterField(
+                    model_name='property',
+                    name='id',
+                    field=models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID'),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,40 @@
+from decimal import Decimal
+
+from django.db import migrations, models
+
+
+def populate_derived_fields(apps, schema_editor):
+    Property = apps.get_model('properties', 'Property')
+    batch = []
+    for prop in Property.objects.only('id', 'description', 'price', 'square_feet').iterator(chunk_size=2000):
+        description = prop.description
+        prop.short_description = description[:100] + '...' if len(description) > 100 else description
+        if prop.price is not None and prop.square_feet:
+            prop.price_per_sqft = (prop.price / prop.square_feet).quantize(Decimal('0.0001'))
+        batch.append(prop)
+        if len(batch) >= 2000:
+            Property.objects.bulk_update(batch, ['short_description', 'price_per_sqft'])
+            batch = []
+    if batch:
+        Property.objects.bulk_update(batch, ['short_description', 'price_per_sqft'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0003_property_bigint_pk_public_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='short_description',
+            field=models.CharField(blank=True, editable=False, max_length=103),
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='price_per_sqft',
+            field=models.DecimalField(blank=True, decimal_places=4, editable=False, max_digits=12, null=True),
+        ),
+        migrations.RunPython(populate_derived_fields, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,6 @@
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
-from django.utils import timezone
+from decimal import Decimal
 import uuid
 
 class Property(models.Model):
@@ -15,7 +15,9 @@ class Property(models.Model):
         ('loft', 'Loft'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Sequential primary key keeps B-tree inserts append-only; the UUID is
+    # the identifier exposed in URLs and cache keys
+    public_id = models.UUIDField(unique=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=200)
     description = models.TextField()
     price = models.DecimalField(max_digits=10, decimal_places=2, validators=[MinValueValidator(0)])
@@ -26,6 +28,11 @@ class Property(models.Model):
     square_feet = models.PositiveIntegerField(null=True, blank=True)
     is_available = models.BooleanField(default=True)
     featured = models.BooleanField(default=False)
+    # Denormalized from description / price / square_feet on save
+    short_description = models.CharField(max_length=103, blank=True, editable=False)
+    price_per_sqft = models.DecimalField(
+        max_digits=12, decimal_places=4, null=True, blank=True, editable=False
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -33,23 +40,71 @@ class Property(models.Model):
         verbose_name_plural = 'properties'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['price']),
-            models.Index(fields=['location']),
-            models.Index(fields=['property_type']),
-            models.Index(fields=['created_at']),
+            # Named as in migrations 0001 and 0005, not Django's computed names
+            models.Index(fields=['price'], name='properties_price_1234_idx'),
+            models.Index(fields=['location'], name='properties_locatio_abcd_idx'),
+            models.Index(fields=['property_type'], name='properties_propert_5678_idx'),
+            models.Index(fields=['created_at'], name='properties_created_efgh_idx'),
+            models.Index(fields=['updated_at'], name='properties__updated_9a6c4e_idx'),
+            # Covers the list query: filter by type/availability, newest first
+            models.Index(
+                fields=['property_type', 'is_available', '-created_at'],
+                name='prop_type_avail_created_idx',
+                include=['title', 'price', 'location'],
+            ),
         ]
     
+    # Fields whose previous values the signals need to invalidate caches
+    TRACKED_FIELDS = ('property_type', 'featured')
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember tracked field values as loaded from the database"""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            name: value
+            for name, value in zip(field_names, values)
+            if name in cls.TRACKED_FIELDS
+        }
+        return instance
+    
     def __str__(self):
         return f"{self.title} - {self.location}"
     
-    @property
-    def price_per_sqft(self):
-        """Calculate price per square foot"""
-        if self.square_feet and self.square_feet > 0:
-            return self.price / self.square_feet
-        return None
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            self.refresh_derived_fields()
+        else:
+            # Partial save: recompute (and write) only what the sources affect
+            update_fields = set(update_fields)
+            kwargs['update_fields'] = update_fields | self.refresh_derived_fields(update_fields)
+        
+        super().save(*args, **kwargs)
     
-    @property
-    def short_description(self):
-        """Get first 100 characters of description"""
-        return self.description[:100] + '...' if len(self.description) > 100 else self.description
+    def refresh_derived_fields(self, changed_fields=None):
+        """
+        Compute short_description and price_per_sqft from their source fields
+        
+        Args:
+            changed_fields (set, optional): Only refresh values derived from these
+        
+        Returns:
+            set: Names of the derived fields that were refreshed
+        """
+        refreshed = set()
+        
+        if changed_fields is None or 'description' in changed_fields:
+            self.short_description = (
+                self.description[:100] + '...' if len(self.description) > 100 else self.description
+            )
+            refreshed.add('short_description')
+        
+        if changed_fields is None or changed_fields & {'price', 'square_feet'}:
+            if self.price is not None and self.square_feet and self.square_feet > 0:
+                self.price_per_sqft = (Decimal(self.price) / self.square_feet).quantize(Decimal('0.0001'))
+            else:
+                self.price_per_sqft = None
+            refreshed.add('price_per_sqft')
+        
+        return refreshed
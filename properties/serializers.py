@@ -0,0 +1,17 @@
+from rest_framework import serializers
+from .models import Property
+from .utils import PROPERTY_CARD_FIELDS
+
+
+class PropertyCardSerializer(serializers.ModelSerializer):
+    """
+    Read-only property card for list endpoints
+
+    Serializes the ``.values(*PROPERTY_CARD_FIELDS)`` dicts cached by
+    get_all_properties(); DRF reads dict rows by key.
+    """
+
+    class Meta:
+        model = Property
+        fields = PROPERTY_CARD_FIELDS
+        read_only_fields = PROPERTY_CARD_FIELDS
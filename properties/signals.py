@@ -1,115 +1,113 @@
 import logging
+from itertools import islice
 from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
-from django.core.cache import cache
 from .models import Property
+from . import tasks
+from .cache_clients import near_cache_clear
+from .utils import redis_connection
 
 logger = logging.getLogger(__name__)
 
-@receiver(post_save, sender=Property)
-def invalidate_cache_on_save(sender, instance, created, **kwargs):
+def _property_cache_keys(instance):
     """
-    Invalidate cache when a property is saved
+    Cache keys that depend on the given property
     """
-    cache_keys_to_delete = [
+    cache_keys = [
         'all_properties',
-        'all_properties_timestamp',
+        'all_properties_json',
+        'properties_last_modified',
         f'properties_type_{instance.property_type}',
+        f'property_{instance.public_id}',
     ]
     
     # Add featured properties cache key if property is featured
     if instance.featured:
-        cache_keys_to_delete.append('featured_properties')
-    
-    # Delete cache keys
-    deleted_count = 0
-    for key in cache_keys_to_delete:
-        if cache.delete(key):
-            deleted_count += 1
+        cache_keys.append('featured_properties')
     
-    logger.info(
-        f"Cache invalidated on {'creation' if created else 'update'} "
-        f"of property {instance.id}. {deleted_count} cache keys deleted."
-    )
+    return cache_keys
+
+@receiver(post_save, sender=Property)
+def invalidate_cache_on_save(sender, instance, created, **kwargs):
+    """
+    Invalidate cache when a property is saved
+    """
+    cache_keys_to_delete = _property_cache_keys(instance)
     
-    # Also invalidate the specific property cache
-    property_cache_key = f'property_{instance.id}'
-    if cache.delete(property_cache_key):
-        logger.info(f"Invalidated cache for property {instance.id}")
-        deleted_count += 1
+    # Keys made stale by field changes detected in pre_save
+    cache_keys_to_delete.extend(instance.__dict__.pop('_stale_cache_keys', ()))
     
-    # Signal to update search index (if you have one)
-    update_search_index(instance, created)
+    # Redis invalidation and search indexing run off the request path
+    tasks.delay(
+        tasks.invalidate_keys,
+        cache_keys_to_delete,
+        instance.public_id,
+        'creation' if created else 'update',
+    )
 
 @receiver(post_delete, sender=Property)
 def invalidate_cache_on_delete(sender, instance, **kwargs):
     """
     Invalidate cache when a property is deleted
     """
-    cache_keys_to_delete = [
-        'all_properties',
-        'all_properties_timestamp',
-        f'properties_type_{instance.property_type}',
-        f'property_{instance.id}',
-    ]
-    
-    if instance.featured:
-        cache_keys_to_delete.append('featured_properties')
-    
-    deleted_count = 0
-    for key in cache_keys_to_delete:
-        if cache.delete(key):
-            deleted_count += 1
-    
-    logger.info(
-        f"Cache invalidated on deletion of property {instance.id}. "
-        f"{deleted_count} cache keys deleted."
+    tasks.delay(
+        tasks.invalidate_keys,
+        _property_cache_keys(instance),
+        instance.public_id,
+        'deletion',
     )
-    
-    # Signal to remove from search index
-    remove_from_search_index(instance)
 
 @receiver(pre_save, sender=Property)
 def check_property_changes(sender, instance, **kwargs):
     """
     Check what fields changed to optimize cache invalidation
     """
-    if instance.pk:
-        try:
-            old_instance = Property.objects.get(pk=instance.pk)
-            
-            # Check if property type changed
-            if old_instance.property_type != instance.property_type:
-                logger.info(
-                    f"Property type changed from {old_instance.property_type} "
-                    f"to {instance.property_type}"
-                )
-                # Invalidate old property type cache
-                cache.delete(f'properties_type_{old_instance.property_type}')
-            
-            # Check if featured status changed
-            if old_instance.featured != instance.featured:
-                logger.info(
-                    f"Featured status changed from {old_instance.featured} "
-                    f"to {instance.featured}"
-                )
-                cache.delete('featured_properties')
-                
-        except Property.DoesNotExist:
-            pass
+    if instance._state.adding:
+        return
+    
+    # Values captured by Property.from_db; only query when the instance
+    # was not loaded from the database and only the columns we compare
+    old_values = getattr(instance, '_loaded_values', None)
+    if old_values is None or len(old_values) < len(Property.TRACKED_FIELDS):
+        row = Property.objects.filter(pk=instance.pk).values_list(
+            *Property.TRACKED_FIELDS
+        ).first()
+        if row is None:
+            return
+        old_values = dict(zip(Property.TRACKED_FIELDS, row))
+    
+    stale_keys = []
+    
+    # Old property type list is stale if the type changed
+    if old_values['property_type'] != instance.property_type:
+        stale_keys.append(f"properties_type_{old_values['property_type']}")
+    
+    # Featured list is stale if the featured status changed
+    if old_values['featured'] != instance.featured:
+        stale_keys.append('featured_properties')
+    
+    # Deleted by invalidate_cache_on_save together with the other keys
+    instance._stale_cache_keys = stale_keys
 
-def update_search_index(instance, created):
+@receiver(post_save, sender=Property)
+def refresh_loaded_values(sender, instance, **kwargs):
     """
-    Update search index (placeholder for actual search implementation)
+    Keep the tracked field snapshot in sync after a successful save
     """
-    # This would be implemented with Elasticsearch, Algolia, etc.
-    logger.debug(f"Search index update needed for property {instance.id}")
+    instance._loaded_values = {
+        name: getattr(instance, name) for name in Property.TRACKED_FIELDS
+    }
 
-def remove_from_search_index(instance):
+def _chunked(iterable, size):
     """
-    Remove from search index (placeholder)
+    Yield lists of up to ``size`` items from ``iterable``
     """
-    logger.debug(f"Remove from search index needed for property {instance.id}")
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
 
 # Batch cache invalidation signal
 def invalidate_all_property_caches():
@@ -117,18 +115,24 @@ def invalidate_all_property_caches():
     Invalidate all property-related caches
     Useful for bulk operations or cache cleanup
     """
-    # Pattern match to find all property cache keys
-    from django_redis import get_redis_connection
-    
     try:
-        redis_conn = get_redis_connection("default")
+        redis_conn = redis_connection("default")
         
-        # Find all keys with property prefix
+        # Iterate keys with SCAN instead of the blocking KEYS command
         pattern = "property_listings:*property*"
-        keys = redis_conn.keys(pattern)
+        keys = redis_conn.scan_iter(match=pattern, count=1000)
+        
+        deleted = 0
+        pipe = redis_conn.pipeline(transaction=False)
+        for key_batch in _chunked(keys, 500):
+            # UNLINK frees memory in a Redis background thread
+            pipe.unlink(*key_batch)
+            deleted += sum(pipe.execute())
+        
+        # Deleted behind the cache client's back
+        near_cache_clear()
         
-        if keys:
-            deleted = redis_conn.delete(*keys)
+        if deleted:
             logger.info(f"Bulk cache invalidation: {deleted} keys deleted")
         else:
             logger.info("No property cache keys found for bulk invalidation")
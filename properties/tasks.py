@@ -0,0 +1,73 @@
+"""
+Background tasks for property cache maintenance
+"""
+import atexit
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from django.db import transaction
+from .utils import delete_keys_and_bump_version
+
+logger = logging.getLogger(__name__)
+
+# Small in-process pool so signal handlers never block the request on Redis
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='properties-tasks')
+atexit.register(_executor.shutdown, wait=True)
+
+
+def delay(func, *args, **kwargs):
+    """
+    Run a task in the background once the current transaction commits
+
+    Args:
+        func (callable): Task to run
+        *args, **kwargs: Arguments passed to the task
+    """
+    transaction.on_commit(lambda: _executor.submit(_run, func, *args, **kwargs))
+
+
+def _run(func, *args, **kwargs):
+    try:
+        func(*args, **kwargs)
+    except Exception as e:
+        logger.error(f"Background task {func.__name__} failed: {e}")
+
+
+def invalidate_keys(cache_keys, property_id, action):
+    """
+    Invalidate property cache keys and sync the search index
+
+    Args:
+        cache_keys (list): Cache keys to delete
+        property_id (str/UUID): Property public ID
+        action (str): 'creation', 'update' or 'deletion'
+    """
+    # One EVALSHA: the list ETag version bumped and all keys deleted
+    # atomically in a single round trip. Cached list and detail pages need
+    # no SCAN: their key prefix carries that version
+    deleted_count = delete_keys_and_bump_version(cache_keys)
+
+    logger.debug(f"Invalidating cache keys {cache_keys}")
+    logger.info(
+        f"Cache invalidated on {action} of property {property_id}. "
+        f"{deleted_count} cache keys deleted."
+    )
+
+    if action == 'deletion':
+        remove_from_search_index(property_id)
+    else:
+        update_search_index(property_id, action == 'creation')
+
+
+def update_search_index(property_id, created):
+    """
+    Update search index (placeholder for actual search implementation)
+    """
+    # This would be implemented with Elasticsearch, Algolia, etc.
+    logger.debug(f"Search index update needed for property {property_id}")
+
+
+def remove_from_search_index(property_id):
+    """
+    Remove from search index (placeholder)
+    """
+    logger.debug(f"Remove from search index needed for property {property_id}")
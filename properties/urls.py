@@ -1,15 +1,25 @@
 from django.urls import path
 from . import views
+from .utils import PROPERTY_LIST_PAGE_CACHE_PREFIX
 
 app_name = 'properties'
 
 urlpatterns = [
     # HTML views
-    path('', views.PropertyListView.as_view(), name='property_list'),
-    path('<uuid:pk>/', views.PropertyDetailView.as_view(), name='property_detail'),
+    path(
+        '',
+        views.property_list_condition(
+            views.versioned_cache_page(300, key_prefix=PROPERTY_LIST_PAGE_CACHE_PREFIX)(
+                views.PropertyListView.as_view()
+            )
+        ),
+        name='property_list',
+    ),
+    path('<uuid:public_id>/', views.PropertyDetailView.as_view(), name='property_detail'),
     
     # API views
-    path('api/', views.property_list_view, name='property_list_api'),
+    path('api/', views.property_list, name='property_list_api'),
     path('api/list/', views.PropertyListAPIView.as_view(), name='property_list_api_v2'),
     path('api/stats/', views.CacheStatsView.as_view(), name='cache_stats'),
+    path('api/health/', views.CacheHealthView.as_view(), name='cache_health'),
 ]
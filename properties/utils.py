@@ -1,143 +1,514 @@
 """
 Utilities for property caching and Redis metrics
+
+The metrics helpers parse multi-KB INFO replies and expect the hiredis
+parser configured in CACHES['default']['OPTIONS']['PARSER_CLASS'].
 """
+import atexit
 import logging
 from django.core.cache import cache
+from django.db.models import Max
 from django_redis import get_redis_connection
+from redis.exceptions import LockNotOwnedError, ResponseError
+from .cache_clients import near_cache_clear, near_cache_evict, near_cache_observe_version
+from .log_handlers import queued_file_logger
 from .models import Property
-from datetime import datetime
-import json
+from collections import Counter
+from datetime import datetime, timezone
+from decimal import Decimal
+from functools import lru_cache
+import orjson
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# cache_page key prefix for the property list page (see urls.py)
+PROPERTY_LIST_PAGE_CACHE_PREFIX = 'property_list'
+
+# cache_page key prefix for the property detail page (see views.py)
+PROPERTY_DETAIL_PAGE_CACHE_PREFIX = 'property_detail'
+
+# Cached under property_{id} for IDs that don't exist (negative caching)
+MISSING_PROPERTY = '__miss__'
+
+# Columns needed to render a property card in list endpoints
+PROPERTY_CARD_FIELDS = (
+    'public_id',
+    'title',
+    'short_description',
+    'price',
+    'location',
+    'property_type',
+    'bedrooms',
+    'bathrooms',
+    'is_available',
+    'featured',
+    'created_at',
+)
 
 
-def get_redis_cache_metrics():
+@lru_cache(maxsize=4)
+def redis_connection(alias='default'):
+    """
+    Get the raw Redis client for a cache alias, looked up once per process
+    
+    The client is safe to keep across forks: redis-py's connection pool
+    notices the PID change and opens fresh sockets in the child.
+    """
+    return get_redis_connection(alias)
+
+
+# INFO results are reused for this many seconds by the metrics helpers
+INFO_CACHE_SECONDS = 5
+
+# INFO sections holding the fields the metrics read
+INFO_SECTIONS = ('stats', 'memory', 'clients', 'server')
+
+
+@lru_cache(maxsize=1)
+def _info_for_window(window):
+    # Connect to Redis via django_redis
+    redis_conn = redis_connection("default")
+    
+    # Only the needed sections, fetched in one round trip
+    pipe = redis_conn.pipeline(transaction=False)
+    for section in INFO_SECTIONS:
+        pipe.info(section)
+    
+    info = {}
+    for section_info in pipe.execute():
+        info.update(section_info)
+    return info
+
+
+def _collect_info():
+    """
+    Get Redis INFO output, shared across calls within INFO_CACHE_SECONDS
+    """
+    return _info_for_window(int(time.time()) // INFO_CACHE_SECONDS)
+
+
+# Optional nested sections of get_redis_cache_metrics()
+METRIC_SECTIONS = ('memory_usage', 'additional_info')
+
+
+def get_redis_cache_metrics(info=None, sections=METRIC_SECTIONS):
     """
     Retrieve and analyze Redis cache hit/miss metrics.
     
+    Args:
+        info (dict, optional): Pre-fetched Redis INFO output to reuse
+        sections (tuple): Nested sections to build (see METRIC_SECTIONS);
+            hit/miss fields are always included
+    
     Returns:
         dict: Cache metrics including hit ratio
     """
     try:
-        # Connect to Redis via django_redis
-        redis_conn = get_redis_connection("default")
-        
-        # Get Redis INFO command output
-        info = redis_conn.info()
-        
-        # Retrieve keyspace_hits and keyspace_misses
-        keyspace_hits = info.get('keyspace_hits', 0)
-        keyspace_misses = info.get('keyspace_misses', 0)
-        
-        # Calculate total requests
-        total_requests = keyspace_hits + keyspace_misses
-        
-        # Calculate hit ratio - EXACTLY as required
-        if total_requests > 0:
-            hit_ratio = (keyspace_hits / total_requests) * 100
-        else:
-            hit_ratio = 0
-        
-        # Also get memory usage for comprehensive metrics
-        used_memory = info.get('used_memory', 0)
-        used_memory_human = info.get('used_memory_human', '0B')
-        max_memory = info.get('maxmemory', 0)
-        
-        # Calculate memory usage percentage if max_memory is set
-        memory_usage_percent = 0
-        if max_memory > 0:
-            memory_usage_percent = (used_memory / max_memory) * 100
-        
-        # Build metrics dictionary
-        metrics = {
-            'status': 'success',
-            'timestamp': datetime.now().isoformat(),
-            'keyspace_hits': keyspace_hits,
-            'keyspace_misses': keyspace_misses,
-            'total_requests': total_requests,
-            'hit_ratio': round(hit_ratio, 2),  # Rounded to 2 decimal places
-            'memory_usage': {
-                'used_memory_bytes': used_memory,
-                'used_memory_human': used_memory_human,
-                'max_memory_bytes': max_memory,
-                'memory_usage_percent': round(memory_usage_percent, 2),
-            },
-            'additional_info': {
-                'connected_clients': info.get('connected_clients', 0),
-                'uptime_days': info.get('uptime_in_days', 0),
-                'instantaneous_ops_per_sec': info.get('instantaneous_ops_per_sec', 0),
+        if info is None:
+            # Whole metrics dict shared across calls within INFO_CACHE_SECONDS;
+            # callers get their own copy of it and of its nested sections
+            metrics = _metrics_for_window(
+                int(time.time()) // INFO_CACHE_SECONDS, tuple(sections)
+            )
+            return {
+                key: dict(value) if isinstance(value, dict) else value
+                for key, value in metrics.items()
             }
-        }
-        
-        # Log the metrics
-        logger.info(
-            f"Cache Metrics - Hits: {keyspace_hits}, Misses: {keyspace_misses}, "
-            f"Hit Ratio: {hit_ratio:.2f}%"
-        )
-        
-        return metrics
+        return _build_metrics(info, sections)
         
     except Exception as e:
         logger.error(f"Error retrieving Redis cache metrics: {e}")
-        
-        return {
-            'status': 'error',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat(),
-            'keyspace_hits': 0,
-            'keyspace_misses': 0,
-            'total_requests': 0,
-            'hit_ratio': 0,
+        return metrics_error(e)
+
+
+def metrics_error(error):
+    """
+    Metrics payload reported when Redis can't be queried
+    
+    Args:
+        error (Exception): The error raised while reading from Redis
+    
+    Returns:
+        dict: Error status with zeroed hit/miss fields
+    """
+    return {
+        'status': 'error',
+        'error': str(error),
+        'timestamp': datetime.now().isoformat(),
+        'keyspace_hits': 0,
+        'keyspace_misses': 0,
+        'total_requests': 0,
+        'hit_ratio': 0,
+    }
+
+
+@lru_cache(maxsize=4)
+def _metrics_for_window(window, sections):
+    return _build_metrics(_info_for_window(window), sections)
+
+
+def _build_metrics(info, sections):
+    # Unpack every field once into locals
+    get = info.get
+    keyspace_hits = get('keyspace_hits', 0)
+    keyspace_misses = get('keyspace_misses', 0)
+    
+    # Calculate total requests and ratios; one division, no branches
+    total_requests = keyspace_hits + keyspace_misses
+    inv_total = 100.0 / (total_requests or 1)
+    hit_ratio = keyspace_hits * inv_total
+    miss_ratio = keyspace_misses * inv_total
+    
+    metrics = {
+        'status': 'success',
+        'timestamp': datetime.now().isoformat(),
+        'keyspace_hits': keyspace_hits,
+        'keyspace_misses': keyspace_misses,
+        'total_requests': total_requests,
+        'hit_ratio': round(hit_ratio, 2),  # Rounded to 2 decimal places
+        'miss_ratio': round(miss_ratio, 2),
+    }
+    
+    # Only build the sections the caller asked for
+    if 'memory_usage' in sections:
+        used_memory = get('used_memory', 0)
+        max_memory = get('maxmemory', 0)
+        memory_usage_percent = used_memory * 100 / max_memory if max_memory > 0 else 0
+        metrics['memory_usage'] = {
+            'used_memory_bytes': used_memory,
+            'used_memory_human': get('used_memory_human', '0B'),
+            'max_memory_bytes': max_memory,
+            'memory_usage_percent': round(memory_usage_percent, 2),
+        }
+    
+    if 'additional_info' in sections:
+        metrics['additional_info'] = {
+            'connected_clients': get('connected_clients', 0),
+            'uptime_days': get('uptime_in_days', 0),
+            'instantaneous_ops_per_sec': get('instantaneous_ops_per_sec', 0),
         }
+    
+    # Log the metrics
+    logger.info(
+        f"Cache Metrics - Hits: {keyspace_hits}, Misses: {keyspace_misses}, "
+        f"Hit Ratio: {hit_ratio:.2f}%"
+    )
+    
+    return metrics
+
+# Per-keyspace hit/miss counters: one Redis HASH per keyspace and window
+CACHE_STATS_KEYSPACES = (
+    'all_properties',
+    'all_properties_json',
+    'properties_last_modified',
+    'properties_type',
+    'property',
+)
+CACHE_STATS_BUCKET_SECONDS = 300
+CACHE_STATS_BUCKETS = 12  # Windows kept (and reported): one hour
+CACHE_STATS_FLUSH_SECONDS = 10
+
+# Counted in process memory and flushed in batches, so lookups answered by
+# the near cache don't pay a Redis round trip for their bookkeeping
+_lookup_counts = Counter()
+_lookup_counts_lock = threading.Lock()
+_next_stats_flush = 0.0
+
+
+def _cache_stats_key(keyspace, bucket):
+    return cache.make_key(f'metrics:{keyspace}:{bucket}')
+
+
+def record_cache_lookup(keyspace, hit, count=1):
+    """
+    Count cache hits or misses for a keyspace in the current window
+    
+    Args:
+        keyspace (str): One of CACHE_STATS_KEYSPACES
+        hit (bool): Whether the lookup was served from the cache
+        count (int): Number of lookups to record
+    """
+    global _next_stats_flush
+    
+    if not count:
+        return
+    
+    bucket = int(time.time()) // CACHE_STATS_BUCKET_SECONDS
+    field = 'hit' if hit else 'miss'
+    now = time.monotonic()
+    
+    with _lookup_counts_lock:
+        _lookup_counts[keyspace, bucket, field] += count
+        if now < _next_stats_flush:
+            return
+        _next_stats_flush = now + CACHE_STATS_FLUSH_SECONDS
+        pending = dict(_lookup_counts)
+        _lookup_counts.clear()
+    
+    flush_cache_lookups(pending)
+
+
+def flush_cache_lookups(pending=None):
+    """
+    Write counted lookups to Redis with HINCRBY in one pipelined round trip
+    
+    Args:
+        pending (dict, optional): {(keyspace, bucket, field): count}; defaults
+            to everything counted so far in this process
+    """
+    if pending is None:
+        with _lookup_counts_lock:
+            pending = dict(_lookup_counts)
+            _lookup_counts.clear()
+    
+    if not pending:
+        return
+    
+    try:
+        pipe = redis_connection("default").pipeline(transaction=False)
+        for (keyspace, bucket, field), count in pending.items():
+            stats_key = _cache_stats_key(keyspace, bucket)
+            pipe.hincrby(stats_key, field, count)
+            pipe.expire(stats_key, CACHE_STATS_BUCKET_SECONDS * CACHE_STATS_BUCKETS)
+        pipe.execute()
+    except Exception as e:
+        # Telemetry only; never fail the lookup that triggered the flush
+        logger.warning(f"Error flushing cache lookup counters: {e}")
+
+
+# Don't drop the last few seconds of counts when the worker exits
+atexit.register(flush_cache_lookups)
+
+
+def get_keyspace_hit_rates(buckets=CACHE_STATS_BUCKETS):
+    """
+    Aggregate per-keyspace hit/miss counters over the most recent windows
+    
+    Args:
+        buckets (int): Number of CACHE_STATS_BUCKET_SECONDS windows to sum
+    
+    Returns:
+        dict: {keyspace: {'hits', 'misses', 'hit_ratio'}}
+    """
+    current = int(time.time()) // CACHE_STATS_BUCKET_SECONDS
+    
+    pipe = redis_connection("default").pipeline(transaction=False)
+    for keyspace in CACHE_STATS_KEYSPACES:
+        for bucket in range(current - buckets + 1, current + 1):
+            pipe.hmget(_cache_stats_key(keyspace, bucket), 'hit', 'miss')
+    results = iter(pipe.execute())
+    
+    hit_rates = {}
+    for keyspace in CACHE_STATS_KEYSPACES:
+        hits = misses = 0
+        for _ in range(buckets):
+            bucket_hits, bucket_misses = next(results)
+            hits += int(bucket_hits or 0)
+            misses += int(bucket_misses or 0)
+        hit_rates[keyspace] = {
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': round(hits * 100.0 / (hits + misses or 1), 2),
+        }
+    return hit_rates
+
+
+def format_cache_timestamp(timestamp):
+    """
+    Format an epoch-seconds cache timestamp as an ISO 8601 UTC string
+    
+    Args:
+        timestamp (int): Epoch seconds stored with a cached payload, or None
+    
+    Returns:
+        str: ISO 8601 timestamp, or None
+    """
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+def _rebuild_once(cache_key, rebuild, force_refresh=False):
+    """
+    Rebuild a cold cache key under a per-key lock (single flight)
+    
+    When a hot key expires, only the worker holding the lock queries the
+    database; the others wait and then read the freshly cached value.
+    
+    Args:
+        cache_key (str): Cache key being rebuilt
+        rebuild (callable): Loads the value from the database and caches it
+        force_refresh (bool): Always rebuild, even if another worker just did
+    
+    Returns:
+        The cached or rebuilt value
+    """
+    lock = cache.lock(f'lock:{cache_key}', timeout=10, blocking_timeout=5)
+    
+    if not lock.acquire():
+        # Lock holder is too slow; serve from the database rather than fail
+        logger.warning(f"Timed out waiting for rebuild lock on {cache_key}")
+        return rebuild()
+    
+    try:
+        # Another worker may have rebuilt the key while we waited
+        if not force_refresh:
+            cached_data = cache.get(cache_key)
+            if cached_data is not None:
+                logger.info(f"Cache rebuilt by another worker for {cache_key}")
+                return cached_data
+        
+        return rebuild()
+    finally:
+        try:
+            lock.release()
+        except LockNotOwnedError:
+            # The rebuild outlived the lock timeout; its result still stands
+            logger.warning(f"Rebuild lock on {cache_key} expired before release")
+
 
 def get_all_properties(force_refresh=False):
     """
     Get all properties with Redis caching
     
+    Only the card columns (PROPERTY_CARD_FIELDS) are fetched and cached,
+    which keeps large descriptions out of the cached payload.
+    
     Args:
         force_refresh (bool): Force cache refresh
     
     Returns:
-        QuerySet: All properties
+        list: Property dicts with the card columns
     """
     cache_key = 'all_properties'
     
-    # Check if we should force refresh
+    # A forced refresh overwrites the key, so skip reading (or deleting) it
     if force_refresh:
         logger.info("Forcing cache refresh for all properties")
-        cache.delete(cache_key)
+    else:
+        cached_data = cache.get(cache_key)
+        record_cache_lookup('all_properties', cached_data is not None)
+        
+        if cached_data is not None:
+            logger.info(f"Cache hit for {cache_key}")
+            return cached_data
+        
+        logger.info(f"Cache miss for {cache_key}, fetching from database")
+    
+    def rebuild():
+        # Get from database
+        properties = list(
+            Property.objects.order_by('-created_at').values(*PROPERTY_CARD_FIELDS)
+        )
+        
+        # Cache for 1 hour (3600 seconds)
+        cache.set(cache_key, properties, 3600)
+        
+        logger.info(f"Cached {len(properties)} properties for 1 hour")
+        
+        return properties
+    
+    return _rebuild_once(cache_key, rebuild, force_refresh)
+
+
+def _json_default(obj):
+    # orjson has no Decimal support; render like DRF's DecimalField
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def get_all_properties_json(force_refresh=False):
+    """
+    Get all property cards as pre-encoded JSON with Redis caching
+    
+    Cache hits skip both the database and per-request serialization; the
+    bytes can be embedded in a response as-is.
+    
+    Args:
+        force_refresh (bool): Force cache refresh
+    
+    Returns:
+        dict: {'rows_json': JSON array bytes, 'count': number of rows,
+            'cached_at': epoch seconds when the payload was cached, None on a miss}
+    """
+    cache_key = 'all_properties_json'
+    
+    if not force_refresh:
+        # The timestamp travels inside the payload; one GET, no extra key
+        cached_data = cache.get(cache_key)
+        record_cache_lookup('all_properties_json', cached_data is not None)
+        if cached_data is not None:
+            logger.info(f"Cache hit for {cache_key}")
+            return cached_data
+    
+    properties = get_all_properties(force_refresh=force_refresh)
+    payload = {
+        # UTC datetimes as ...Z, as DRF's DateTimeField writes them
+        'rows_json': orjson.dumps(properties, default=_json_default, option=orjson.OPT_UTC_Z),
+        'count': len(properties),
+        'cached_at': int(time.time()),
+    }
+    cache.set(cache_key, payload, 3600)
+    logger.info(f"Cached JSON for {payload['count']} properties under {cache_key}")
+    
+    return dict(payload, cached_at=None)
+
+
+# Bumped (INCR) by tasks.invalidate_keys on every property write or delete;
+# never expires and is never part of an invalidation
+PROPERTIES_VERSION_KEY = 'properties_version'
+
+
+def get_properties_version():
+    """
+    Get the property change counter
     
-    # Try to get from cache
-    cached_data = cache.get(cache_key)
+    Unlike MAX(updated_at), it also moves when a property is deleted.
     
-    if cached_data is not None and not force_refresh:
-        logger.info(f"Cache hit for {cache_key}")
-        return cached_data
+    Returns:
+        int: Number of property changes seen, 0 if none yet
+    """
+    version = cache.get(PROPERTIES_VERSION_KEY, 0)
     
-    # Cache miss or force refresh
-    logger.info(f"Cache miss for {cache_key}, fetching from database")
+    # Changes made by other processes invalidate this process's near cache
+    near_cache_observe_version(version)
+    return version
+
+
+def get_properties_last_modified():
+    """
+    Get the most recent property update time with caching
     
-    # Get from database
-    queryset = Property.objects.all().select_related().order_by('-created_at')
+    Part of the ETag on list endpoints; the cached value is invalidated by
+    the property signals.
     
-    # Cache for 1 hour (3600 seconds)
-    cache.set(cache_key, queryset, 3600)
+    Returns:
+        datetime: Latest updated_at, or None if there are no properties
+    """
+    cache_key = 'properties_last_modified'
     
-    # Also store timestamp
-    cache.set(f'{cache_key}_timestamp', datetime.now().isoformat(), 3600)
+    last_modified = cache.get(cache_key)
+    record_cache_lookup('properties_last_modified', last_modified is not None)
+    if last_modified is not None:
+        return last_modified
     
-    logger.info(f"Cached {queryset.count()} properties for 1 hour")
+    # Single index lookup on updated_at
+    last_modified = Property.objects.aggregate(last_modified=Max('updated_at'))['last_modified']
+    if last_modified is not None:
+        cache.set(cache_key, last_modified, 3600)
     
-    return queryset
+    return last_modified
 
 
 def get_property_by_id(property_id):
     """
-    Get property by ID with caching
+    Get property by public ID with caching
     
     Args:
-        property_id (str/UUID): Property ID
+        property_id (str/UUID): Property public ID
     
     Returns:
         Property: Property instance or None
@@ -146,14 +517,19 @@ def get_property_by_id(property_id):
     
     # Try cache first
     cached_property = cache.get(cache_key)
+    record_cache_lookup('property', cached_property is not None)
+    
+    if cached_property == MISSING_PROPERTY:
+        logger.info(f"Negative cache hit for property {property_id}")
+        return None
     
-    if cached_property:
+    if cached_property is not None:
         logger.info(f"Cache hit for property {property_id}")
         return cached_property
     
     # Cache miss, get from database
     try:
-        property_obj = Property.objects.get(id=property_id)
+        property_obj = Property.objects.get(public_id=property_id)
         
         # Cache for 2 hours
         cache.set(cache_key, property_obj, 7200)
@@ -161,22 +537,69 @@ def get_property_by_id(property_id):
         
         return property_obj
     except Property.DoesNotExist:
+        # Remember the miss briefly so repeated lookups skip the database;
+        # the post_save signal clears it if the property gets created
+        cache.set(cache_key, MISSING_PROPERTY, 60)
         logger.warning(f"Property {property_id} not found")
         return None
 
 
+def get_properties_by_ids(property_ids):
+    """
+    Get several properties with one cache round trip
+    
+    Cached properties are read with a single MGET; misses are loaded
+    with one IN query and written back with a single pipelined SET.
+    
+    Args:
+        property_ids (list): Property public IDs, in the order to return them
+    
+    Returns:
+        list: Property instances (IDs that don't exist are skipped)
+    """
+    cache_keys = {property_id: f'property_{property_id}' for property_id in property_ids}
+    cached = cache.get_many(cache_keys.values())
+    
+    missing = [
+        property_id for property_id, key in cache_keys.items()
+        if key not in cached
+    ]
+    record_cache_lookup('property', True, len(cached))
+    record_cache_lookup('property', False, len(missing))
+    
+    if missing:
+        fetched = Property.objects.in_bulk(missing, field_name='public_id')
+        cache.set_many(
+            {f'property_{pk}': property_obj for pk, property_obj in fetched.items()},
+            7200,
+        )
+        for pk, property_obj in fetched.items():
+            cached[f'property_{pk}'] = property_obj
+        logger.info(f"Cache miss for {len(missing)} of {len(cache_keys)} properties, now cached")
+    
+    return [
+        cached[key] for key in cache_keys.values()
+        if key in cached and cached[key] != MISSING_PROPERTY
+    ]
+
+
 def cache_property_queryset(queryset, cache_key, timeout=3600):
     """
     Cache a property queryset
     
     Args:
-        queryset: Django queryset
+        queryset: Django queryset or list (evaluated once before caching)
         cache_key (str): Cache key
         timeout (int): Cache timeout in seconds
+    
+    Returns:
+        list: The cached properties
     """
-    cache.set(cache_key, queryset, timeout)
-    cache.set(f'{cache_key}_timestamp', datetime.now().isoformat(), timeout)
-    logger.info(f"Cached {queryset.count()} properties under {cache_key} for {timeout} seconds")
+    properties = list(queryset)
+    cache.set(cache_key, properties, timeout)
+    logger.info(f"Cached {len(properties)} properties under {cache_key} for {timeout} seconds")
+    
+    return properties
 
 
 def get_cached_properties_by_type(property_type, force_refresh=False):
@@ -188,30 +611,111 @@ def get_cached_properties_by_type(property_type, force_refresh=False):
         force_refresh (bool): Force cache refresh
     
     Returns:
-        QuerySet: Filtered properties
+        list: Property dicts with the card columns
     """
     cache_key = f'properties_type_{property_type}'
     
-    if force_refresh:
-        cache.delete(cache_key)
+    if not force_refresh:
+        cached_data = cache.get(cache_key)
+        record_cache_lookup('properties_type', cached_data is not None)
+        
+        if cached_data is not None:
+            logger.info(f"Cache hit for properties type {property_type}")
+            return cached_data
+    
+    def rebuild():
+        # Get from database, evaluated once; plain dicts pack natively
+        # with msgpack instead of falling back to pickled model instances
+        properties = list(Property.objects.filter(
+            property_type=property_type,
+            is_available=True
+        ).order_by('-created_at').values(*PROPERTY_CARD_FIELDS))
+        
+        # Cache for 30 minutes
+        cache.set(cache_key, properties, 1800)
+        logger.info(f"Cached {len(properties)} {property_type} properties")
+        
+        return properties
+    
+    return _rebuild_once(cache_key, rebuild, force_refresh)
+
+
+# List keys cleared by invalidate_property_cache(); without an ID the
+# per-type keys are also matched by pattern
+_ALL_PROPERTIES_KEYS = ('all_properties', 'all_properties_json', 'properties_last_modified')
+
+# SCANs the keyspace for KEYS[1] and UNLINKs matches; returns the count
+UNLINK_PATTERN_SCRIPT = """
+local cursor = '0'
+local deleted = 0
+repeat
+    local result = redis.call('SCAN', cursor, 'MATCH', KEYS[1], 'COUNT', 1000)
+    cursor = result[1]
+    if #result[2] > 0 then
+        deleted = deleted + redis.call('UNLINK', unpack(result[2]))
+    end
+until cursor == '0'
+return deleted
+"""
+
+
+@lru_cache(maxsize=None)
+def _register_script(source):
+    return redis_connection("default").register_script(source)
+
+
+# Bumps the change counter in KEYS[1], deletes the remaining KEYS
+# server-side and returns how many of them existed
+INVALIDATE_KEYS_SCRIPT = """
+redis.call('INCR', KEYS[1])
+if #KEYS < 2 then
+    return 0
+end
+return redis.call('DEL', unpack(KEYS, 2))
+"""
+
+
+def delete_keys_and_bump_version(cache_keys):
+    """
+    Delete cache keys and bump PROPERTIES_VERSION_KEY in one round trip
+    
+    Bumping the version moves the list ETag and retires every versioned
+    page cache (see views.versioned_cache_page) together with the keys.
+    
+    Args:
+        cache_keys (iterable): Unprefixed cache keys to delete
+    
+    Returns:
+        int: Number of keys that existed
+    """
+    made_keys = [cache.make_key(key) for key in (PROPERTIES_VERSION_KEY, *cache_keys)]
+    deleted_count = _register_script(INVALIDATE_KEYS_SCRIPT)(keys=made_keys)
     
-    cached_data = cache.get(cache_key)
+    # The script bypasses the cache client, so evict this process's copies
+    near_cache_evict(made_keys)
+    return deleted_count
+
+
+def unlink_pattern(pattern):
+    """
+    Delete cache keys matching a pattern in a single round trip
     
-    if cached_data is not None and not force_refresh:
-        logger.info(f"Cache hit for properties type {property_type}")
-        return cached_data
+    The scan runs inside Redis, so this is meant for small keyspaces and
+    maintenance paths, not per-request work. UNLINK frees memory in a
+    background thread.
     
-    # Get from database
-    queryset = Property.objects.filter(
-        property_type=property_type,
-        is_available=True
-    ).order_by('-created_at')
+    Args:
+        pattern (str): Unprefixed cache key pattern, e.g. 'properties_type_*'
     
-    # Cache for 30 minutes
-    cache.set(cache_key, queryset, 1800)
-    logger.info(f"Cached {queryset.count()} {property_type} properties")
+    Returns:
+        int: Number of keys deleted
+    """
+    script = _register_script(UNLINK_PATTERN_SCRIPT)
+    deleted_count = script(keys=[cache.make_key(pattern)])
     
-    return queryset
+    # Deleted behind the cache client's back
+    near_cache_clear()
+    return deleted_count
 
 
 def invalidate_property_cache(property_id=None):
@@ -219,44 +723,54 @@ def invalidate_property_cache(property_id=None):
     Invalidate property cache
     
     Args:
-        property_id (str/UUID, optional): Specific property ID
+        property_id (str/UUID, optional): Specific property public ID
     
     Returns:
         int: Number of cache keys invalidated
     """
+    deleted_count = 0
+    
     if property_id:
         # Invalidate specific property cache
         cache_keys = [
             f'property_{property_id}',
-            'all_properties',  # Also invalidate all properties cache
+            *_ALL_PROPERTIES_KEYS,  # Also invalidate the list caches
         ]
     else:
         # Invalidate all property-related caches
-        cache_keys = [
-            'all_properties',
-            'all_properties_timestamp',
-        ]
+        cache_keys = _ALL_PROPERTIES_KEYS
         
-        # Get all property type cache keys
-        for prop_type, _ in Property.PROPERTY_TYPES:
-            cache_keys.append(f'properties_type_{prop_type}')
-    
-    # Delete cache keys
-    deleted_count = 0
-    for key in cache_keys:
-        if cache.delete(key):
-            deleted_count += 1
-            logger.info(f"Invalidated cache key: {key}")
-    
+        # All property type cache keys, matched server-side
+        try:
+            deleted_count += unlink_pattern('properties_type_*')
+        except ResponseError as e:
+            # Redis without UNLINK / scripting: client-side SCAN + DEL, which
+            # still catches keys for types outside PROPERTY_TYPES
+            logger.warning(f"Pattern invalidation unavailable, falling back: {e}")
+            deleted_count += cache.delete_pattern('properties_type_*', itersize=500)
+    
+    # Delete cache keys and bump the list version in a single EVALSHA, so
+    # direct invalidations (e.g. after QuerySet.update) move the ETag and
+    # the page caches too
+    deleted_count += delete_keys_and_bump_version(cache_keys)
+    
+    logger.debug(f"Invalidated cache keys: {cache_keys}")
     logger.info(f"Invalidated {deleted_count} cache keys")
     return deleted_count
 
-def log_cache_metrics():
+CACHE_METRICS_LOG_FILE = '/tmp/crm_report_log.txt'
+
+
+def log_cache_metrics(info=None):
     """
     Log cache metrics to /tmp/crm_report_log.txt
+    
+    Args:
+        info (dict, optional): Pre-fetched Redis INFO output to reuse
     """
     try:
-        metrics = get_redis_cache_metrics()
+        # Only the hit/miss counters are logged
+        metrics = get_redis_cache_metrics(info, sections=())
         
         if metrics['status'] == 'success':
             log_entry = {
@@ -267,11 +781,12 @@ def log_cache_metrics():
                 'total_requests': metrics['total_requests'],
             }
             
-            log_file = '/tmp/crm_report_log.txt'
-            with open(log_file, 'a') as f:
-                f.write(json.dumps(log_entry) + '\n')
+            # Appended to the file by a background QueueListener, which keeps
+            # one O_APPEND handle open instead of reopening it per entry
+            metrics_logger = queued_file_logger('properties.cache_metrics', CACHE_METRICS_LOG_FILE)
+            metrics_logger.info(orjson.dumps(log_entry).decode())
             
-            logger.info(f"Logged cache metrics to {log_file}")
+            logger.info(f"Logged cache metrics to {CACHE_METRICS_LOG_FILE}")
             return True
         else:
             logger.error(f"Failed to get metrics for logging: {metrics.get('error')}")
@@ -282,11 +797,14 @@ def log_cache_metrics():
         return False
 
 
-def get_cache_performance_summary():
+def get_cache_performance_summary(info=None):
     """
     Get a summary of cache performance
+    
+    Args:
+        info (dict, optional): Pre-fetched Redis INFO output to reuse
     """
-    metrics = get_redis_cache_metrics()
+    metrics = get_redis_cache_metrics(info, sections=('memory_usage',))
     
     if metrics['status'] == 'success':
         summary = {
@@ -310,3 +828,47 @@ def get_cache_performance_summary():
     return {'error': metrics.get('error', 'Unknown error')}
 
 
+def get_cache_health_check():
+    """
+    Check Redis health in a single round trip
+    
+    PING and the stats/memory/clients INFO sections go out in one
+    pipeline; unlike get_redis_cache_metrics this never reuses a cached
+    INFO snapshot, so the reported latency is live.
+    
+    Returns:
+        dict: Health status, ping latency and headline metrics
+    """
+    try:
+        pipe = redis_connection("default").pipeline(transaction=False)
+        pipe.ping()
+        pipe.info('stats')
+        pipe.info('memory')
+        pipe.info('clients')
+        
+        started = time.perf_counter()
+        ping, stats, memory, clients = pipe.execute()
+        ping_response_ms = (time.perf_counter() - started) * 1000
+        
+        keyspace_hits = stats.get('keyspace_hits', 0)
+        total_requests = keyspace_hits + stats.get('keyspace_misses', 0)
+        used_memory = memory.get('used_memory', 0)
+        max_memory = memory.get('maxmemory', 0)
+        
+        return {
+            'status': 'healthy' if ping else 'unhealthy',
+            'timestamp': datetime.now().isoformat(),
+            'ping_response_ms': round(ping_response_ms, 2),
+            'hit_ratio': round(keyspace_hits * 100 / (total_requests or 1), 2),
+            'memory_usage_percent': round(used_memory * 100 / max_memory, 2) if max_memory > 0 else 0,
+            'connected_clients': clients.get('connected_clients', 0),
+        }
+        
+    except Exception as e:
+        logger.error(f"Cache health check failed: {e}")
+        
+        return {
+            'status': 'unhealthy',
+            'error': str(e),
+            'timestamp': datetime.now().isoformat(),
+        }
@@ -1,54 +1,96 @@
-from django.shortcuts import render, get_object_or_404
+from functools import lru_cache, wraps
 from django.views.decorators.cache import cache_page
+from django.views.decorators.http import condition
 from django.core.cache import cache
 from django.utils.decorators import method_decorator
 from django.views.generic import ListView, DetailView
-from rest_framework import generics, permissions, status
-from rest_framework.response import Response
+from rest_framework import generics, permissions
 from rest_framework.decorators import api_view
 from rest_framework.views import APIView
 import logging
+import orjson
 from .models import Property
-from .serializers import PropertySerializer
-from .utils import get_all_properties, get_redis_cache_metrics
-from django.http import JsonResponse
-from .utils import get_all_properties, get_property_by_id
+from .serializers import PropertyCardSerializer
+from django.http import Http404, HttpResponse
+from .utils import get_all_properties, get_all_properties_json, get_properties_by_ids, get_redis_cache_metrics
+from .utils import format_cache_timestamp, get_cache_health_check
+from .utils import get_properties_last_modified, get_properties_version
+from .utils import PROPERTY_LIST_PAGE_CACHE_PREFIX, MISSING_PROPERTY
+from .utils import PROPERTY_DETAIL_PAGE_CACHE_PREFIX
+from .utils import flush_cache_lookups, get_keyspace_hit_rates, metrics_error, record_cache_lookup
 
 logger = logging.getLogger(__name__)
 
-@cache_page(60 * 15)
+def _request_properties_version(request):
+    # Read once per request and shared by the ETag and the page cache prefix
+    version = getattr(request, '_properties_version', None)
+    if version is None:
+        version = request._properties_version = get_properties_version()
+    return version
+
+def _properties_etag(request, *args, **kwargs):
+    # The change counter catches deletes, which leave MAX(updated_at) as is
+    version = _request_properties_version(request)
+    last_modified = get_properties_last_modified()
+    return f"{version}-{last_modified.isoformat() if last_modified else 0}"
+
+# Conditional GET for property lists: answers 304 before any cache/DB work.
+# No Last-Modified: MAX(updated_at) doesn't move on delete, so clients
+# sending only If-Modified-Since would keep a list with deleted properties
+property_list_condition = condition(etag_func=_properties_etag)
+
+def versioned_cache_page(timeout, key_prefix):
+    """
+    cache_page whose key prefix carries the property change counter
+
+    Every property write bumps the counter, so pages cached before it are
+    simply no longer looked up (and expire on their own TTL) instead of
+    being found with a keyspace SCAN on each write.
+    """
+    def decorator(view_func):
+        # One CacheMiddleware per version, not per request; the previous
+        # version is kept for requests still in flight when it moves
+        @lru_cache(maxsize=2)
+        def _cached_view(version):
+            return cache_page(timeout, key_prefix=f'{key_prefix}.v{version}')(view_func)
+
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            version = _request_properties_version(request)
+            return _cached_view(version)(request, *args, **kwargs)
+        return _wrapped_view
+    return decorator
+
+@property_list_condition
+@versioned_cache_page(60 * 15, key_prefix=PROPERTY_LIST_PAGE_CACHE_PREFIX)
 @api_view(['GET'])
 def property_list(request):
     """
     View-based caching for property list using utility function
     """
-    # Use utility function for low-level caching
-    properties = get_all_properties()
-    
     # Check if we should force refresh
     force_refresh = request.GET.get('refresh') == 'true'
-    if force_refresh:
-        properties = get_all_properties(force_refresh=True)
-    
-    serializer = PropertySerializer(properties, many=True)
     
-    # Get cache info
-    cache_timestamp = cache.get('all_properties_timestamp')
+    # Use utility function for low-level caching of the encoded rows;
+    # the cache timestamp is stored inside the cached payload
+    payload = get_all_properties_json(force_refresh=force_refresh)
+    cache_timestamp = payload['cached_at']
     
-    return Response({
-        'count': properties.count(),
-        'properties': serializer.data,
+    # Rows are embedded as pre-encoded JSON; no serializer pass per request
+    body = orjson.dumps({
+        'count': payload['count'],
+        'properties': orjson.Fragment(payload['rows_json']),
         'cache_info': {
             'is_cached': cache_timestamp is not None and not force_refresh,
-            'cached_at': cache_timestamp,
+            'cached_at': format_cache_timestamp(cache_timestamp),
             'cache_strategy': 'low_level + view_level',
             'view_cache_timeout': 15 * 60,
             'queryset_cache_timeout': 60 * 60,
         }
     })
+    return HttpResponse(body, content_type='application/json')
 
-# Class-based view with caching
-@method_decorator(cache_page(60 * 15), name='dispatch')
+# Class-based view, page-cached in urls.py
 class PropertyListView(ListView):
     model = Property
     template_name = 'properties/property_list.html'
@@ -77,51 +119,70 @@ class PropertyListView(ListView):
         if max_price:
             queryset = queryset.filter(price__lte=max_price)
         
-        return queryset.order_by('-created_at')
+        # Only the ordered IDs come from the database, objects from cache
+        return queryset.order_by('-created_at').values_list('public_id', flat=True)
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        properties = get_properties_by_ids(list(context['object_list']))
+        context['object_list'] = context[self.context_object_name] = properties
         context['property_types'] = Property.PROPERTY_TYPES
         context['cache_info'] = {
             'is_cached': True,
-            'timeout': 15,
+            'timeout': 5,
             'metric': 'minutes'
         }
         return context
 
 # REST API View with caching
 class PropertyListAPIView(generics.ListAPIView):
-    serializer_class = PropertySerializer
+    serializer_class = PropertyCardSerializer
     permission_classes = [permissions.AllowAny]
     
-    @method_decorator(cache_page(60 * 15))
+    @method_decorator(property_list_condition)
+    @method_decorator(versioned_cache_page(60 * 15, key_prefix=PROPERTY_LIST_PAGE_CACHE_PREFIX))
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
     
     def get_queryset(self):
-        # Use utility function for queryset caching
+        # Use utility function for queryset caching; card dicts, hence the
+        # card serializer
         return get_all_properties()
 
 # Property detail view with caching
-@cache_page(60 * 60)  # Cache for 1 hour
+@method_decorator(
+    versioned_cache_page(60 * 60, key_prefix=PROPERTY_DETAIL_PAGE_CACHE_PREFIX),  # Cache for 1 hour
+    name='dispatch',
+)
 class PropertyDetailView(DetailView):
     model = Property
     template_name = 'properties/property_detail.html'
     context_object_name = 'property'
+    slug_field = 'public_id'
+    slug_url_kwarg = 'public_id'
     
     def get_object(self):
         # Try to get from cache first
-        cache_key = f'property_{self.kwargs["pk"]}'
+        cache_key = f'property_{self.kwargs["public_id"]}'
         property_data = cache.get(cache_key)
+        record_cache_lookup('property', property_data is not None)
         
-        if property_data:
-            logger.info(f"Cache hit for property {self.kwargs['pk']}")
+        if property_data == MISSING_PROPERTY:
+            raise Http404("No property found matching the query")
+        
+        if property_data is not None:
+            logger.info(f"Cache hit for property {self.kwargs['public_id']}")
             return property_data
         
         # Cache miss, get from database
-        property_obj = get_object_or_404(Property, id=self.kwargs['pk'])
+        property_obj = Property.objects.filter(public_id=self.kwargs['public_id']).first()
+        if property_obj is None:
+            # Same short-lived sentinel as get_property_by_id()
+            cache.set(cache_key, MISSING_PROPERTY, 60)
+            raise Http404("No property found matching the query")
+        
         cache.set(cache_key, property_obj, 60 * 60)  # Cache for 1 hour
-        logger.info(f"Cache miss for property {self.kwargs['pk']}")
+        logger.info(f"Cache miss for property {self.kwargs['public_id']}")
         
         return property_obj
 
@@ -132,4 +193,25 @@ class CacheStatsView(APIView):
     def get(self, request):
         """Get Redis cache statistics"""
         metrics = get_redis_cache_metrics()
-        return JsonResponse(metrics)
+        if metrics['status'] == 'success':
+            flush_cache_lookups()
+            try:
+                metrics['keyspaces'] = get_keyspace_hit_rates()
+            except Exception as e:
+                # The metrics above may come from before Redis went away
+                logger.error(f"Error retrieving keyspace hit rates: {e}")
+                metrics = metrics_error(e)
+        return HttpResponse(orjson.dumps(metrics), content_type='application/json')
+
+# Cache health check view
+class CacheHealthView(APIView):
+    permission_classes = [permissions.AllowAny]
+    
+    def get(self, request):
+        """Get Redis health in a single round trip"""
+        health = get_cache_health_check()
+        return HttpResponse(
+            orjson.dumps(health),
+            content_type='application/json',
+            status=200 if health['status'] == 'healthy' else 503,
+        )